@@ -211,33 +211,12 @@ class DocumentToken(str, Enum):
     @classmethod
     def create_token_name_from_doc_item_label(cls, label: str, level: int = 1) -> str:
         """Get token corresponding to passed doc item label."""
-        doc_token_by_item_label = {
-            DocItemLabel.CAPTION: DocumentToken.CAPTION,
-            DocItemLabel.FOOTNOTE: DocumentToken.FOOTNOTE,
-            DocItemLabel.FORMULA: DocumentToken.FORMULA,
-            DocItemLabel.LIST_ITEM: DocumentToken.LIST_ITEM,
-            DocItemLabel.PAGE_FOOTER: DocumentToken.PAGE_FOOTER,
-            DocItemLabel.PAGE_HEADER: DocumentToken.PAGE_HEADER,
-            DocItemLabel.PICTURE: DocumentToken.PICTURE,
-            DocItemLabel.TABLE: DocumentToken.TABLE,
-            DocItemLabel.TEXT: DocumentToken.TEXT,
-            DocItemLabel.TITLE: DocumentToken.TITLE,
-            DocItemLabel.DOCUMENT_INDEX: DocumentToken.DOCUMENT_INDEX,
-            DocItemLabel.CODE: DocumentToken.CODE,
-            DocItemLabel.CHECKBOX_SELECTED: DocumentToken.CHECKBOX_SELECTED,
-            DocItemLabel.CHECKBOX_UNSELECTED: DocumentToken.CHECKBOX_UNSELECTED,
-            DocItemLabel.FORM: DocumentToken.FORM,
-            DocItemLabel.KEY_VALUE_REGION: DocumentToken.KEY_VALUE_REGION,
-            DocItemLabel.PARAGRAPH: DocumentToken.PARAGRAPH,
-            DocItemLabel.REFERENCE: DocumentToken.REFERENCE,
-        }
-
         res: str
         if label == DocItemLabel.SECTION_HEADER:
             res = f"{_SECTION_HEADER_PREFIX}{level}"
         else:
             try:
-                res = doc_token_by_item_label[DocItemLabel(label)].value
+                res = _DOC_TOKEN_BY_ITEM_LABEL[DocItemLabel(label)].value
             except KeyError as e:
                 raise RuntimeError(f"Unexpected DocItemLabel: {label}") from e
         return res
@@ -290,3 +269,26 @@ class DocumentToken(str, Enum):
         loc_str = f"{x0_tok}{y0_tok}{x1_tok}{y1_tok}"
 
         return loc_str
+
+
+# built once at import time; serializers look up a token per document item
+_DOC_TOKEN_BY_ITEM_LABEL = {
+    DocItemLabel.CAPTION: DocumentToken.CAPTION,
+    DocItemLabel.FOOTNOTE: DocumentToken.FOOTNOTE,
+    DocItemLabel.FORMULA: DocumentToken.FORMULA,
+    DocItemLabel.LIST_ITEM: DocumentToken.LIST_ITEM,
+    DocItemLabel.PAGE_FOOTER: DocumentToken.PAGE_FOOTER,
+    DocItemLabel.PAGE_HEADER: DocumentToken.PAGE_HEADER,
+    DocItemLabel.PICTURE: DocumentToken.PICTURE,
+    DocItemLabel.TABLE: DocumentToken.TABLE,
+    DocItemLabel.TEXT: DocumentToken.TEXT,
+    DocItemLabel.TITLE: DocumentToken.TITLE,
+    DocItemLabel.DOCUMENT_INDEX: DocumentToken.DOCUMENT_INDEX,
+    DocItemLabel.CODE: DocumentToken.CODE,
+    DocItemLabel.CHECKBOX_SELECTED: DocumentToken.CHECKBOX_SELECTED,
+    DocItemLabel.CHECKBOX_UNSELECTED: DocumentToken.CHECKBOX_UNSELECTED,
+    DocItemLabel.FORM: DocumentToken.FORM,
+    DocItemLabel.KEY_VALUE_REGION: DocumentToken.KEY_VALUE_REGION,
+    DocItemLabel.PARAGRAPH: DocumentToken.PARAGRAPH,
+    DocItemLabel.REFERENCE: DocumentToken.REFERENCE,
+}
@@ -6,17 +6,47 @@
 """Module for custom type validators."""
 import json
 import logging
+import re
 from datetime import datetime
+from functools import lru_cache
 from importlib import resources
-from typing import Hashable, TypeVar
+from typing import TYPE_CHECKING, Hashable, TypeVar
 
-import jsonschema
 from pydantic_core import PydanticCustomError
 
+if TYPE_CHECKING:
+    import jsonschema
+
 logger = logging.getLogger("docling-core")
 
 T = TypeVar("T", bound=Hashable)
 
+# Compiled once at import time: scanning a DocTags string must not pay for
+# rebuilding the tag grammar on every call.
+_DOCTAGS_TAG_PATTERN = re.compile(r"<(/?)([^<>]+)>")
+
+# Tags carrying a dynamic suffix, e.g. <loc_125> or <section_header_level_2>.
+_DOCTAGS_STANDALONE_SUFFIX_PATTERN = re.compile(r"(?:loc|link)_\d+")
+_DOCTAGS_PAIRED_SUFFIX_PATTERN = re.compile(r"(?:section_header_level|key|value)_\d+")
+
+
+@lru_cache(maxsize=None)
+def _get_validator(schema_name: str) -> "jsonschema.Draft7Validator":
+    """Load a document schema and compile it into a validator, once per schema."""
+    # deferred so that consumers of the pydantic validators do not pay for the
+    # jsonschema import
+    import jsonschema
+
+    schema_txt = (
+        resources.files("docling_core")
+        .joinpath(f"resources/schemas/legacy_doc/{schema_name}")
+        .read_text("utf-8")
+    )
+    schema = json.loads(schema_txt)
+    jsonschema.Draft7Validator.check_schema(schema)
+
+    return jsonschema.Draft7Validator(schema)
+
 
 def validate_schema(file_: dict, schema: dict) -> tuple[bool, str]:
     """Check wheter the workflow is properly formatted JSON and contains valid keys.
@@ -24,6 +54,8 @@ def validate_schema(file_: dict, schema: dict) -> tuple[bool, str]:
     Where possible, this also checks a few basic dependencies between properties, but
     this functionality is limited.
     """
+    import jsonschema
+
     try:
         jsonschema.validate(file_, schema)
         return (True, "All good!")
@@ -32,46 +64,116 @@ def validate_schema(file_: dict, schema: dict) -> tuple[bool, str]:
         return (False, err.message)
 
 
+def _validate_with_schema(file_: dict, schema_name: str) -> tuple[bool, str]:
+    """Validate a file against a cached, precompiled document schema."""
+    validator = _get_validator(schema_name)
+
+    # cheap structural pre-checks before walking the whole instance
+    if not isinstance(file_, dict):
+        return (False, f"{file_!r} is not of type 'object'")
+    for key in validator.schema.get("required", ()):
+        if key not in file_:
+            return (False, f"'{key}' is a required property")
+
+    error = next(validator.iter_errors(file_), None)
+    if error is None:
+        return (True, "All good!")
+
+    return (False, error.message)
+
+
 def validate_raw_schema(file_: dict) -> tuple[bool, str]:
     """Validate a RAW file."""
     logger.debug("validate RAW schema ... ")
 
-    schema_txt = (
-        resources.files("docling_core")
-        .joinpath("resources/schemas/legacy_doc/RAW.json")
-        .read_text("utf-8")
-    )
-    schema = json.loads(schema_txt)
-
-    return validate_schema(file_, schema)
+    return _validate_with_schema(file_, "RAW.json")
 
 
 def validate_ann_schema(file_: dict) -> tuple[bool, str]:
     """Validate an annotated (ANN) file."""
     logger.debug("validate ANN schema ... ")
 
-    schema_txt = (
-        resources.files("docling_core")
-        .joinpath("resources/schemas/legacy_doc/ANN.json")
-        .read_text("utf-8")
-    )
-    schema = json.loads(schema_txt)
-
-    return validate_schema(file_, schema)
+    return _validate_with_schema(file_, "ANN.json")
 
 
 def validate_ocr_schema(file_: dict) -> tuple[bool, str]:
     """Validate an OCR file."""
     logger.debug("validate OCR schema ... ")
 
-    schema_txt = (
-        resources.files("docling_core")
-        .joinpath("resources/schemas/legacy_doc/OCR-output.json")
-        .read_text("utf-8")
+    return _validate_with_schema(file_, "OCR-output.json")
+
+
+@lru_cache(maxsize=1)
+def _get_doctags_vocabulary() -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+    """Build the paired and standalone DocTags tag sets, once.
+
+    The import of the token enums is deferred to avoid a circular import with
+    docling_core.types.
+    """
+    from docling_core.types.doc.tokens import (
+        DocumentToken,
+        TableToken,
+        _CodeLanguageToken,
+        _PictureClassificationToken,
     )
-    schema = json.loads(schema_txt)
 
-    return validate_schema(file_, schema)
+    paired_tags = {token.value for token in DocumentToken}
+    paired_tags.discard(DocumentToken.PAGE_BREAK.value)
+
+    standalone_tags = {DocumentToken.PAGE_BREAK.value}
+    standalone_tags.update(token.value[1:-1] for token in TableToken)
+    standalone_tags.update(token.value[1:-1] for token in _PictureClassificationToken)
+    standalone_tags.update(token.value[1:-1] for token in _CodeLanguageToken)
+    # stop token emitted by VLMs at the end of a page
+    standalone_tags.add("end_of_utterance")
+
+    verbatim_tags = frozenset({DocumentToken.CODE.value, DocumentToken.FORMULA.value})
+
+    return (frozenset(paired_tags), frozenset(standalone_tags), verbatim_tags)
+
+
+def validate_doctags(input_dt: str) -> tuple[bool, str]:
+    """Check whether a DocTags string is well-formed.
+
+    Verifies that every tag belongs to the DocTags vocabulary and that opening
+    and closing tags are properly nested. The content of code and formula
+    elements is treated as verbatim: everything up to the matching closing tag
+    is skipped, so code listings or formulas containing markup-like text do
+    not fail validation.
+    """
+    paired_tags, standalone_tags, verbatim_tags = _get_doctags_vocabulary()
+
+    stack: list[str] = []
+    for match in _DOCTAGS_TAG_PATTERN.finditer(input_dt):
+        closing, name = match.groups()
+        if stack and stack[-1] in verbatim_tags:
+            # inside a code or formula element only the matching closing tag
+            # is markup; anything else is verbatim content
+            if closing and name == stack[-1]:
+                stack.pop()
+            continue
+        if name not in paired_tags and not _DOCTAGS_PAIRED_SUFFIX_PATTERN.fullmatch(
+            name
+        ):
+            if closing or (
+                name not in standalone_tags
+                and not _DOCTAGS_STANDALONE_SUFFIX_PATTERN.fullmatch(name)
+            ):
+                slash = "/" if closing else ""
+                return (False, f"Unknown tag <{slash}{name}>")
+        elif closing:
+            if not stack:
+                return (False, f"Closing tag </{name}> without opening tag")
+            if stack[-1] != name:
+                return (False, f"Closing tag </{name}> does not match <{stack[-1]}>")
+            stack.pop()
+        else:
+            stack.append(name)
+
+    if stack:
+        return (False, f"Unclosed tag <{stack[-1]}>")
+
+    return (True, "All good!")
 
 
 def validate_unique_list(v: list[T]) -> list[T]:
@@ -87,14 +189,20 @@ def validate_unique_list(v: list[T]) -> list[T]:
     Returns:
         The list, after checking for unique items.
     """
-    if len(v) != len(set(v)):
-        raise PydanticCustomError("unique_list", "List must be unique")
+    seen: set[T] = set()
+    for item in v:
+        if item in seen:
+            raise PydanticCustomError("unique_list", "List must be unique")
+        seen.add(item)
     return v
 
 
 def validate_datetime(v, handler):
     """Validate that a value is a datetime or a non-numeric string."""
-    if type(v) is datetime or (type(v) is str and not v.isnumeric()):
+    if isinstance(v, datetime):
+        return handler(v)
+    # checking the first character short-circuits the full-string scan for the
+    # common case of a non-numeric string
+    if isinstance(v, str) and (not v or not v[0].isnumeric() or not v.isnumeric()):
         return handler(v)
-    else:
-        raise ValueError("Value type must be a datetime or a non-numeric string")
+    raise ValueError("Value type must be a datetime or a non-numeric string")
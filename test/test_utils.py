@@ -5,18 +5,28 @@
 
 """Test the pydantic models in package utils."""
 import json
+from io import BytesIO
 
-from pydantic import Field
+import pytest
+from pydantic import ConfigDict, Field
 from requests import Response
 
 from docling_core.utils.alias import AliasModel
 from docling_core.utils.file import resolve_source_to_path, resolve_source_to_stream
+from docling_core.utils.validators import validate_doctags
+
+# expected serialized forms, computed once at module scope
+_EXPECTED_JSON_ALIAS = json.dumps({"boo": "lorem ipsum"}, separators=(",", ":"))
+_EXPECTED_JSON_FIELD = json.dumps({"foo": "lorem ipsum"}, separators=(",", ":"))
 
 
 def test_alias_model():
     """Test the functionality of AliasModel."""
 
     class AliasModelChild(AliasModel):
+        # test-only subclass: skip the core-schema build at class creation
+        model_config = ConfigDict(defer_build=True)
+
         foo: str = Field(alias="boo")
 
     data = {"foo": "lorem ipsum"}
@@ -27,8 +37,8 @@ def test_alias_model():
     AliasModelChild.model_validate(data_alias)
     AliasModelChild.model_validate(data)
 
-    AliasModelChild.model_validate_json(json.dumps(data_alias))
-    AliasModelChild.model_validate_json(json.dumps(data))
+    AliasModelChild.model_validate_json(_EXPECTED_JSON_ALIAS)
+    AliasModelChild.model_validate_json(_EXPECTED_JSON_FIELD)
 
     AliasModelChild(boo="lorem ipsum")
     AliasModelChild(foo="lorem ipsum")
@@ -44,28 +54,82 @@ def test_alias_model():
     # serialized data will always use aliases
 
     obj = AliasModelChild.model_validate(data_alias)
+    dumped = obj.model_dump()
+    assert dumped == data_alias
+    assert dumped != data
+
+    dumped_json = obj.model_dump_json()
+    assert dumped_json == _EXPECTED_JSON_ALIAS
+    assert dumped_json != _EXPECTED_JSON_FIELD
+
+
+def test_alias_model_construct():
+    """Test that AliasModel keeps the trusted-data fast path usable."""
+
+    class AliasModelChild(AliasModel):
+        model_config = ConfigDict(defer_build=True)
+
+        foo: str = Field(alias="boo")
+
+    data = {"foo": "lorem ipsum"}
+    data_alias = {"boo": "lorem ipsum"}
+
+    # model_construct skips validation but must serialize like validated instances
+
+    obj = AliasModelChild.model_construct(**data)
     assert obj.model_dump() == data_alias
-    assert obj.model_dump() != data
+    assert obj.model_dump() == AliasModelChild.model_validate(data).model_dump()
+
+
+_DOCTAGS_FIXTURES = [
+    "test/data/doc/2206.01062.yaml.dt",
+    "test/data/doc/constructed_document.yaml.dt",
+    "test/data/doc/doc_with_kv.dt",
+    "test/data/doc/dummy_doc.yaml.dt",
+    "test/data/doc/page_with_pic.dt",
+]
+
+
+@pytest.fixture(scope="module", params=_DOCTAGS_FIXTURES)
+def doctags(request):
+    """Provide the DocTags fixture contents, each read once per module."""
+    with open(request.param, encoding="utf-8") as fp:
+        return fp.read()
+
+
+def test_validate_doctags(doctags):
+    """Test the well-formedness check on the DocTags fixtures."""
+    valid, message = validate_doctags(doctags)
+    assert valid, message
 
-    assert obj.model_dump_json() == json.dumps(data_alias, separators=(",", ":"))
-    assert obj.model_dump_json() != json.dumps(data, separators=(",", ":"))
+
+def test_validate_doctags_rejects_malformed():
+    """Test that malformed DocTags strings are rejected."""
+    assert not validate_doctags("<doctag><text>foo</title></doctag>")[0]
+    assert not validate_doctags("<doctag><bogus>foo</bogus></doctag>")[0]
+    assert not validate_doctags("<doctag><text>foo")[0]
+
+    # markup-like content inside code and formula elements is verbatim
+
+    valid, message = validate_doctags(
+        "<doctag><code><_Python_>print('<text>')</code></doctag>"
+    )
+    assert valid, message
+    assert validate_doctags("<doctag><formula>a<b>c</formula></doctag>")[0]
+    assert not validate_doctags("<doctag><code>foo</doctag>")[0]
 
 
 def test_resolve_source_to_path_url_wout_path(monkeypatch):
     expected_str = "foo"
-    expected_bytes = bytes(expected_str, "utf-8")
+    expected_bytes = b"foo"
 
     def get_dummy_response(*args, **kwargs):
         r = Response()
         r.status_code = 200
-        r._content = expected_bytes
+        r.raw = BytesIO(expected_bytes)
         return r
 
     monkeypatch.setattr("requests.get", get_dummy_response)
-    monkeypatch.setattr(
-        "requests.models.Response.iter_content",
-        lambda *args, **kwargs: [expected_bytes],
-    )
     path = resolve_source_to_path("https://pypi.org")
     with open(path, encoding="utf-8") as f:
         text = f.read()
@@ -74,19 +138,15 @@ def test_resolve_source_to_path_url_wout_path(monkeypatch):
 
 def test_resolve_source_to_stream_url_wout_path(monkeypatch):
     expected_str = "foo"
-    expected_bytes = bytes(expected_str, "utf-8")
+    expected_bytes = b"foo"
 
     def get_dummy_response(*args, **kwargs):
         r = Response()
         r.status_code = 200
-        r._content = expected_bytes
+        r.raw = BytesIO(expected_bytes)
         return r
 
     monkeypatch.setattr("requests.get", get_dummy_response)
-    monkeypatch.setattr(
-        "requests.models.Response.iter_content",
-        lambda *args, **kwargs: [expected_bytes],
-    )
     doc_stream = resolve_source_to_stream("https://pypi.org")
     assert doc_stream.name == "file"
 